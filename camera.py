@@ -11,6 +11,7 @@ class PlayerCenterCamera(pygame.sprite.Group):
     - half_height (float): Half of the height of the display surface.
     - ground_surface (pygame.Surface): The surface representing the ground.
     - ground_rect (pygame.Rect): The rectangle representing the ground surface.
+    - cull_margin (int): The distance outside the screen that settings.viewport_rect still counts as visible.
 
     Methods:
     - center_target_camera(target: pygame.sprite.Sprite) -> None:
@@ -35,6 +36,9 @@ class PlayerCenterCamera(pygame.sprite.Group):
         self.ground_surface = ground_surface
         self.ground_rect = self.ground_surface.get_rect(topleft=(0, 0))
 
+        self.cull_margin = 100
+        settings.viewport_rect.update(self.display_surface.get_rect().inflate(self.cull_margin * 2, self.cull_margin * 2))
+
     def center_target_camera(self, target: pygame.sprite.Sprite) -> None:
         """
         Centers the camera on the target sprite.
@@ -45,6 +49,8 @@ class PlayerCenterCamera(pygame.sprite.Group):
         settings.global_offset.x = target.rect.centerx - self.half_width
         settings.global_offset.y = target.rect.centery - self.half_height
 
+        settings.viewport_rect.topleft = (settings.global_offset.x - self.cull_margin, settings.global_offset.y - self.cull_margin)
+
     def camera_draw(self, player: pygame.sprite.Sprite) -> None:
         """
         Draws the camera view on the display surface.
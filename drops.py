@@ -19,12 +19,35 @@ class BaseDrop(pygame.sprite.Sprite):
 
         self.pos = pygame.math.Vector2(x, y)
 
+        self.pool = None
+        self.in_pool = False
+
         self.image = pygame.Surface([5, 5])
         self.image.fill((0, 255, 0))
         self.image.set_colorkey((0, 255, 0))
         self.rect = self.image.get_rect()
         self.rect.center = self.pos
 
+    def reset(self, x: int, y: int) -> None:
+        """
+        Reset the drop so it can be reused from a pool.
+
+        Args:
+            x (int): The x-coordinate of the drop's position.
+            y (int): The y-coordinate of the drop's position.
+        """
+        self.pos.update(x, y)
+        self.rect.center = self.pos
+
+    def kill(self) -> None:
+        """
+        Remove the drop from all groups and return it to its pool.
+        """
+        pygame.sprite.Sprite.kill(self)
+
+        if self.pool is not None:
+            self.pool.release(self)
+
     def update(self) -> None:
         """
         Update the drop's state.
@@ -61,10 +84,11 @@ class HealthDrop(BaseDrop):
 
     def pickup(self) -> None:
         """
-        Handle the pickup of the health drop.
+        Handle the pickup of the health drop, healing the player and returning the drop to its pool.
         """
         super().pickup()
         settings.world_reference.player.health += self.health
+        self.kill()
 
 class CoinDrop(BaseDrop):
     """
@@ -1,13 +1,36 @@
 import pygame
 import settings
 import drops
-import random
+import pool
+from random import random, choice
 
 class BaseEnemy(pygame.sprite.Sprite):
     """
     Base class for enemies in the game.
     """
 
+    _surface_cache = {}
+
+    @staticmethod
+    def get_surface(size: int) -> pygame.Surface:
+        """
+        Get the transparent surface shared by every enemy of the given size.
+
+        Args:
+            size (int): The size of the enemy.
+
+        Returns:
+            pygame.Surface: The shared surface.
+        """
+        surface = BaseEnemy._surface_cache.get(size)
+
+        if surface is None:
+            surface = pygame.Surface([size, size]).convert_alpha()
+            surface.fill((0, 0, 0, 0))
+            BaseEnemy._surface_cache[size] = surface
+
+        return surface
+
     def __init__(self, x: int, y: int, size: int) -> None:
         """
         Initialize the BaseEnemy object.
@@ -22,33 +45,78 @@ class BaseEnemy(pygame.sprite.Sprite):
         """
         pygame.sprite.Sprite.__init__(self)
 
-        self.pos = pygame.math.Vector2(x, y)
-        self.vel = pygame.math.Vector2()
+        self.px, self.py = float(x), float(y)
+        self.vx = self.vy = 0.0
+        self.moved = False
+        self.follows_player = False
+        self.collides_with_walls = True
         self.speed = 100
-        self.health = 5
+        self.spawn_health = 5
+        self.health = self.spawn_health
+
+        self.pool = None
+        self.in_pool = False
 
         self.particle_system = None
         self.drop_table = []
         self.drop_chance = 1
 
-        self.image = pygame.Surface([size, size])
-        self.image.fill(settings.color.red)
-        self.image.set_colorkey(settings.color.red)
+        self.image = BaseEnemy.get_surface(size)
         self.rect = self.image.get_rect()
-        self.rect.center = self.pos
+        self.rect.center = (self.px, self.py)
+
+    @property
+    def pos(self) -> pygame.math.Vector2:
+        """
+        Get a copy of the enemy's position for code outside the update loop.
+
+        Returns:
+            pygame.math.Vector2: The enemy's position.
+        """
+        return pygame.math.Vector2(self.px, self.py)
+
+    def reset(self, x: int, y: int) -> None:
+        """
+        Reset the enemy so it can be reused from a pool.
+
+        Args:
+            x (int): The x-coordinate of the enemy's position.
+            y (int): The y-coordinate of the enemy's position.
+
+        Returns:
+            None
+        """
+        self.px, self.py = float(x), float(y)
+        self.vx = self.vy = 0.0
+        self.moved = False
+        self.health = self.spawn_health
+        self.rect.center = (self.px, self.py)
 
-    def update(self) -> None:
+    def update(self, dt: float = None, view_rect: pygame.Rect = None) -> None:
         """
         Update the enemy's position and check for death.
 
+        The particle system is only updated while the enemy is inside the camera view.
+
+        Args:
+            dt (float): The frame delta time, read from settings when not given.
+            view_rect (pygame.Rect): The camera view, read from settings when not given.
+
         Returns:
             None
         """
-        self.pos += self.vel * settings.delta_time
-        self.rect.center = self.pos
+        if dt is None:
+            dt = settings.delta_time
+        if view_rect is None:
+            view_rect = settings.viewport_rect
 
-        if self.particle_system is not None:
-            self.particle_system.update(self.pos.x, self.pos.y)
+        self.px += self.vx * dt
+        self.py += self.vy * dt
+        self.rect.center = (self.px, self.py)
+        self.moved = self.vx != 0 or self.vy != 0
+
+        if self.particle_system is not None and view_rect.colliderect(self.rect):
+            self.particle_system.update(self.px, self.py)
 
         if self.health <= 0:
             self.die()
@@ -57,19 +125,35 @@ class BaseEnemy(pygame.sprite.Sprite):
         """
         Handle the enemy's death, including dropping items.
 
+        An item is dropped with a probability of drop_chance, from 0 to 1.
+
         Returns:
             None
         """
-        drop_draw = random.randint(1, 1)
-
-        if drop_draw == self.drop_chance:
-            drop = random.choice(self.drop_table)
-            instance = drop(self.pos.x, self.pos.y)
-            settings.world_reference.ground_items.add(instance)
-            settings.world_reference.world_camera.add(instance)
+        if self.drop_table and random() < self.drop_chance:
+            world = settings.world_reference
+            drop = choice(self.drop_table)
+            drop_pool = world.drop_pools.get(drop)
+            if drop_pool is None:
+                drop_pool = world.drop_pools[drop] = pool.SpritePool(drop)
+            instance = drop_pool.acquire(self.px, self.py)
+            world.ground_items.add(instance)
+            world.world_camera.add(instance)
 
         self.kill()
 
+    def kill(self) -> None:
+        """
+        Remove the enemy from all groups and return it to its pool.
+
+        Returns:
+            None
+        """
+        pygame.sprite.Sprite.kill(self)
+
+        if self.pool is not None:
+            self.pool.release(self)
+
 
 class FollowEnemy(BaseEnemy):
     """
@@ -92,20 +176,12 @@ class FollowEnemy(BaseEnemy):
         self.tag = "follower"
 
         self.speed = 70
-        self.health = 5
+        self.spawn_health = 5
+        self.health = self.spawn_health
 
         self.drop_table.append(drops.HealthDrop)
         self.drop_table.append(drops.CoinDrop)
 
-    def follow_player(self) -> None:
-        """
-        Make the enemy follow the player.
-
-        Returns:
-            None
-        """
-        self.vel.x, self.vel.y = settings.get_vectors(self, settings.world_reference.player)
-
 
 class FlyerEnemy(BaseEnemy):
     """
@@ -128,16 +204,8 @@ class FlyerEnemy(BaseEnemy):
         self.tag = "flyer follower"
 
         self.speed = 100
-        self.health = 3
+        self.spawn_health = 3
+        self.health = self.spawn_health
 
         self.drop_table.append(drops.HealthDrop)
         self.drop_table.append(drops.CoinDrop)
-
-    def follow_player(self) -> None:
-        """
-        Make the enemy follow the player.
-
-        Returns:
-            None
-        """
-        self.vel.x, self.vel.y = settings.get_vectors(self, settings.world_reference.player)
\ No newline at end of file
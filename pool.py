@@ -0,0 +1,81 @@
+class SpritePool():
+    """
+    A free list of sprites that are reused instead of being constructed again.
+
+    Sprites handed out by the pool release themselves back to it when killed.
+    Pooled sprite classes must provide a reset method taking the same arguments
+    as their constructor, and a kill method that calls release.
+
+    Attributes:
+    - sprite_class (type): The class of sprite held by the pool.
+    - free (list): The released sprites waiting to be reused.
+
+    Methods:
+    - acquire(*args) -> pygame.sprite.Sprite: Returns a reset sprite from the pool.
+    - release(sprite: pygame.sprite.Sprite) -> None: Returns a sprite to the pool.
+    """
+
+    def __init__(self, sprite_class: type, count: int = 0, *args) -> None:
+        """
+        Initializes the SpritePool object.
+
+        Parameters:
+        - sprite_class (type): The class of sprite held by the pool.
+        - count (int): The number of sprites to construct up front.
+        - args: The constructor arguments used for the pre-warmed sprites.
+
+        Returns:
+        - None
+        """
+        self.sprite_class = sprite_class
+        self.free = []
+
+        for c in range(count):
+            self.release(self.create(*args))
+
+    def create(self, *args):
+        """
+        Constructs a new sprite owned by the pool.
+
+        Parameters:
+        - args: The constructor arguments of the sprite.
+
+        Returns:
+        - pygame.sprite.Sprite: The new sprite.
+        """
+        sprite = self.sprite_class(*args)
+        sprite.pool = self
+        return sprite
+
+    def acquire(self, *args):
+        """
+        Returns a sprite from the pool, constructing one if the pool is empty.
+
+        Parameters:
+        - args: The constructor arguments of the sprite.
+
+        Returns:
+        - pygame.sprite.Sprite: The reset sprite.
+        """
+        if self.free:
+            sprite = self.free.pop()
+            sprite.reset(*args)
+        else:
+            sprite = self.create(*args)
+
+        sprite.in_pool = False
+        return sprite
+
+    def release(self, sprite) -> None:
+        """
+        Returns a sprite to the pool, ignoring sprites that were already released.
+
+        Parameters:
+        - sprite (pygame.sprite.Sprite): The sprite to release.
+
+        Returns:
+        - None
+        """
+        if not sprite.in_pool:
+            sprite.in_pool = True
+            self.free.append(sprite)
@@ -39,6 +39,9 @@ class Projectile(pygame.sprite.Sprite):
         self.damage = damage
         self.color = color
 
+        self.pool = None
+        self.in_pool = False
+
         self.image = pygame.Surface([size, size])
         self.image.fill(self.color)
         #self.image.set_colorkey(self.color)
@@ -47,6 +50,62 @@ class Projectile(pygame.sprite.Sprite):
 
         self.vel.x, self.vel.y = settings.get_pos_vectors(self.pos, self.target_pos, self.speed)
 
+    def reset(self,
+              x: int,
+              y: int,
+              target_x: int,
+              target_y: int,
+              size: int,
+              speed: float,
+              damage: int,
+              color: pygame.Color
+              ) -> None:
+        """
+        Reset the projectile so it can be reused from a pool.
+
+        Args:
+            x (int): The x-coordinate of the projectile's starting position.
+            y (int): The y-coordinate of the projectile's starting position.
+            target_x (int): The x-coordinate of the projectile's target position.
+            target_y (int): The y-coordinate of the projectile's target position.
+            size (int): The size of the projectile.
+            speed (float): The speed at which the projectile moves.
+            damage (int): The amount of damage the projectile inflicts.
+            color (pygame.Color): The color of the projectile.
+
+        Returns:
+            None
+        """
+        self.pos.update(x, y)
+        self.target_pos.update(target_x, target_y)
+
+        self.speed = speed
+        self.damage = damage
+
+        if self.image.get_size() != (size, size):
+            self.image = pygame.Surface([size, size])
+            self.image.fill(color)
+            self.rect = self.image.get_rect()
+        elif self.color != color:
+            self.image.fill(color)
+
+        self.color = color
+        self.rect.center = self.pos
+
+        self.vel.x, self.vel.y = settings.get_pos_vectors(self.pos, self.target_pos, self.speed)
+
+    def kill(self) -> None:
+        """
+        Remove the projectile from all groups and return it to its pool.
+
+        Returns:
+            None
+        """
+        pygame.sprite.Sprite.kill(self)
+
+        if self.pool is not None:
+            self.pool.release(self)
+
     def update(self) -> None:
         """
         Update the position of the projectile.
@@ -0,0 +1,179 @@
+import pygame
+
+class FastQuadTree():
+    """
+    A static quadtree used to query sprites that never move, such as walls.
+
+    Attributes:
+    - bounds (pygame.Rect): The area covered by this node.
+    - cx (int): The x-coordinate of the center of this node.
+    - cy (int): The y-coordinate of the center of this node.
+    - items (list): The sprites stored on this node.
+    - item_rects (list): The rects of the sprites stored on this node.
+    - nw, ne, se, sw (FastQuadTree): The child nodes, or None when empty.
+
+    Methods:
+    - hit(rect: pygame.Rect) -> list: Returns the sprites colliding with a rect.
+    """
+
+    def __init__(self, items: list, depth: int = 4, bounding_rect: pygame.Rect = None) -> None:
+        """
+        Initializes the FastQuadTree object.
+
+        Parameters:
+        - items (list): The sprites to store in the tree, each with a rect.
+        - depth (int): The maximum number of levels below this node.
+        - bounding_rect (pygame.Rect): The area covered by this node, defaults to the union of the item rects.
+
+        Returns:
+        - None
+        """
+        items = list(items)
+
+        if bounding_rect is None:
+            if items:
+                bounding_rect = items[0].rect.unionall([i.rect for i in items[1:]])
+            else:
+                bounding_rect = pygame.Rect(0, 0, 0, 0)
+
+        self.bounds = pygame.Rect(bounding_rect)
+        self.cx, self.cy = self.bounds.center
+
+        self.nw = None
+        self.ne = None
+        self.se = None
+        self.sw = None
+
+        if depth <= 0 or len(items) <= 1:
+            self.items = items
+            self.item_rects = [i.rect for i in items]
+            return
+
+        self.items = []
+        nw_items = []
+        ne_items = []
+        se_items = []
+        sw_items = []
+
+        # Sprites straddling a center line stay on this node
+        for i in items:
+            if i.rect.right <= self.cx and i.rect.bottom <= self.cy:
+                nw_items.append(i)
+            elif i.rect.left >= self.cx and i.rect.bottom <= self.cy:
+                ne_items.append(i)
+            elif i.rect.left >= self.cx and i.rect.top >= self.cy:
+                se_items.append(i)
+            elif i.rect.right <= self.cx and i.rect.top >= self.cy:
+                sw_items.append(i)
+            else:
+                self.items.append(i)
+
+        self.item_rects = [i.rect for i in self.items]
+
+        left, top = self.bounds.topleft
+        right, bottom = self.bounds.bottomright
+
+        if nw_items:
+            self.nw = FastQuadTree(nw_items, depth - 1, pygame.Rect(left, top, self.cx - left, self.cy - top))
+        if ne_items:
+            self.ne = FastQuadTree(ne_items, depth - 1, pygame.Rect(self.cx, top, right - self.cx, self.cy - top))
+        if se_items:
+            self.se = FastQuadTree(se_items, depth - 1, pygame.Rect(self.cx, self.cy, right - self.cx, bottom - self.cy))
+        if sw_items:
+            self.sw = FastQuadTree(sw_items, depth - 1, pygame.Rect(left, self.cy, self.cx - left, bottom - self.cy))
+
+    def hit(self, rect: pygame.Rect) -> list:
+        """
+        Returns the sprites whose rects collide with the given rect.
+
+        Parameters:
+        - rect (pygame.Rect): The rect to test against the tree.
+
+        Returns:
+        - list: The colliding sprites.
+        """
+        hits = [self.items[i] for i in rect.collidelistall(self.item_rects)]
+
+        if self.nw is not None and rect.left < self.cx and rect.top < self.cy:
+            hits.extend(self.nw.hit(rect))
+        if self.ne is not None and rect.right > self.cx and rect.top < self.cy:
+            hits.extend(self.ne.hit(rect))
+        if self.se is not None and rect.right > self.cx and rect.bottom > self.cy:
+            hits.extend(self.se.hit(rect))
+        if self.sw is not None and rect.left < self.cx and rect.bottom > self.cy:
+            hits.extend(self.sw.hit(rect))
+
+        return hits
+
+
+class QuadTreeGroup(pygame.sprite.Group):
+    """
+    A sprite group that keeps a FastQuadTree of its sprites.
+
+    The tree is rebuilt lazily the next time it is requested after a sprite is
+    added to or removed from the group, including when a sprite is killed.
+
+    Attributes:
+    - depth (int): The depth of the quadtree.
+    - dirty (bool): Whether the group changed since the tree was built.
+
+    Methods:
+    - get_qtree() -> FastQuadTree: Returns the quadtree, rebuilding it if the group changed.
+    """
+
+    def __init__(self, *sprites, depth: int = 4) -> None:
+        """
+        Initializes the QuadTreeGroup object.
+
+        Parameters:
+        - sprites: The sprites to add to the group.
+        - depth (int): The depth of the quadtree.
+
+        Returns:
+        - None
+        """
+        self.depth = depth
+        self.dirty = True
+        self._qtree = None
+
+        pygame.sprite.Group.__init__(self, *sprites)
+
+    def add_internal(self, sprite: pygame.sprite.Sprite, layer: int = None) -> None:
+        """
+        Adds a sprite to the group and marks the tree dirty.
+
+        Parameters:
+        - sprite (pygame.sprite.Sprite): The sprite to add.
+        - layer (int): Unused, kept for the pygame.sprite.Group signature.
+
+        Returns:
+        - None
+        """
+        pygame.sprite.Group.add_internal(self, sprite, layer)
+        self.dirty = True
+
+    def remove_internal(self, sprite: pygame.sprite.Sprite) -> None:
+        """
+        Removes a sprite from the group and marks the tree dirty.
+
+        Parameters:
+        - sprite (pygame.sprite.Sprite): The sprite to remove.
+
+        Returns:
+        - None
+        """
+        pygame.sprite.Group.remove_internal(self, sprite)
+        self.dirty = True
+
+    def get_qtree(self) -> FastQuadTree:
+        """
+        Returns the quadtree of the group, rebuilding it if the group changed.
+
+        Returns:
+        - FastQuadTree: The quadtree of the group's sprites.
+        """
+        if self.dirty:
+            self._qtree = FastQuadTree(self.sprites(), self.depth)
+            self.dirty = False
+
+        return self._qtree
@@ -1,5 +1,5 @@
 import pygame
-import random
+import os
 import math
 
 SCREEN_WIDTH = 1920
@@ -28,6 +28,56 @@ class ColorLibrary():
         self.green = pygame.Color(0, 255, 0)
         self.blue = pygame.Color(0, 0, 255)
 
+        self._channel_masks = {}
+        self._byte_buffer = os.urandom(3 * 4096)
+        self._byte_index = 0
+
+    def _next_bytes(self, count: int) -> bytes:
+        """
+        Take random bytes from the pre-generated buffer, refilling it when exhausted.
+
+        Parameters:
+        - count: The number of bytes to take.
+
+        Returns:
+        - The random bytes.
+        """
+        i = self._byte_index
+
+        if i + count > len(self._byte_buffer):
+            self._byte_buffer = os.urandom(len(self._byte_buffer))
+            i = 0
+
+        self._byte_index = i + count
+        return self._byte_buffer[i:i + count]
+
+    def _random_int(self, min_value: int, max_value: int) -> int:
+        """
+        Generate a uniform random integer from the byte buffer, like random.randint.
+
+        Draws that would bias the result towards low values are rejected and redrawn.
+
+        Parameters:
+        - min_value: The minimum value, inclusive.
+        - max_value: The maximum value, inclusive.
+
+        Returns:
+        - The random integer.
+        """
+        span = max_value - min_value + 1
+
+        if span <= 0:
+            raise ValueError(f"empty range for _random_int ({min_value}, {max_value})")
+
+        byte_count = max(1, ((span - 1).bit_length() + 7) // 8)
+        space = 256 ** byte_count
+        limit = space - space % span
+
+        while True:
+            value = int.from_bytes(self._next_bytes(byte_count), "little")
+            if value < limit:
+                return min_value + value % span
+
     def random(self) -> pygame.Color:
         """
         Generate a random color.
@@ -35,7 +85,8 @@ class ColorLibrary():
         Returns:
         - A pygame.Color object representing a random color.
         """
-        color = (random.randint(0, 255), random.randint(0, 255), random.randint(0, 255))
+        red, green, blue = self._next_bytes(3)
+        color = (red, green, blue)
         return color
     
     def random_gray(self, min_value: int = 0, max_value: int = 255) -> pygame.Color:
@@ -49,7 +100,7 @@ class ColorLibrary():
         Returns:
         - A pygame.Color object representing a random grayscale color.
         """
-        value = random.randint(min_value, max_value)
+        value = self._random_int(min_value, max_value)
         color = pygame.Color(value, value, value)
         return color
     
@@ -65,22 +116,44 @@ class ColorLibrary():
         Returns:
         - A pygame.Color object representing a random custom color.
         """
-        red = 0
-        green = 0
-        blue = 0
+        mask = self._channel_masks.get(channels)
 
-        if 'r' in channels:
-            red = random.randint(min_value, max_value)
-        if 'g' in channels:
-            green = random.randint(min_value, max_value)
-        if 'b' in channels:
-            blue = random.randint(min_value, max_value)
+        if mask is None:
+            mask = ('r' in channels, 'g' in channels, 'b' in channels)
+            self._channel_masks[channels] = mask
 
-        color = pygame.Color(red, green, blue)
+        color = pygame.Color(self._random_int(min_value, max_value) if mask[0] else 0,
+                             self._random_int(min_value, max_value) if mask[1] else 0,
+                             self._random_int(min_value, max_value) if mask[2] else 0)
 
         return color
     
-def get_vectors(origin: pygame.sprite.Sprite, target: pygame.sprite.Sprite) -> list:
+def get_direction_vectors(origin_x: float, origin_y: float, target_x: float, target_y: float, speed: float) -> tuple:
+    """
+    Calculate the vectors between two points from their raw coordinates.
+
+    Parameters:
+    - origin_x: The x-coordinate of the origin.
+    - origin_y: The y-coordinate of the origin.
+    - target_x: The x-coordinate of the target.
+    - target_y: The y-coordinate of the target.
+    - speed: The speed of the origin.
+
+    Returns:
+    - A tuple containing the x and y components of the vectors, (0, 0) if the points overlap.
+    """
+    dx = target_x - origin_x
+    dy = target_y - origin_y
+    normal = math.sqrt(dx * dx + dy * dy)
+
+    if normal == 0:
+        return 0.0, 0.0
+
+    scale = speed / normal
+
+    return dx * scale, dy * scale
+
+def get_vectors(origin: pygame.sprite.Sprite, target: pygame.sprite.Sprite) -> tuple:
     """
     Calculate the vectors between two sprites.
 
@@ -89,16 +162,11 @@ def get_vectors(origin: pygame.sprite.Sprite, target: pygame.sprite.Sprite) -> l
     - target: The target sprite.
 
     Returns:
-    - A list containing the x and y components of the vectors.
+    - A tuple containing the x and y components of the vectors.
     """
-    distance = [target.pos.x - origin.pos.x, target.pos.y - origin.pos.y]
-    normal = math.sqrt(distance[0] ** 2 + distance[1] ** 2)
-    direction = [distance[0] / normal, distance[1] / normal]
-    vectors = [direction[0] * origin.speed, direction[1] * origin.speed]
+    return get_direction_vectors(origin.pos.x, origin.pos.y, target.pos.x, target.pos.y, origin.speed)
 
-    return vectors
-
-def get_pos_vectors(origin_pos: pygame.math.Vector2, target_pos: pygame.math.Vector2, speed: float) -> list:
+def get_pos_vectors(origin_pos: pygame.math.Vector2, target_pos: pygame.math.Vector2, speed: float) -> tuple:
     """
     Calculate the vectors between two positions.
 
@@ -108,14 +176,35 @@ def get_pos_vectors(origin_pos: pygame.math.Vector2, target_pos: pygame.math.Vec
     - speed: The speed of the origin.
 
     Returns:
-    - A list containing the x and y components of the vectors.
+    - A tuple containing the x and y components of the vectors.
     """
-    distance = [target_pos.x - origin_pos.x, target_pos.y - origin_pos.y]
-    normal = math.sqrt(distance[0] ** 2 + distance[1] ** 2)
-    direction = [distance[0] / normal, distance[1] / normal]
-    vectors = [direction[0] * speed, direction[1] * speed]
+    return get_direction_vectors(origin_pos.x, origin_pos.y, target_pos.x, target_pos.y, speed)
+
+def get_wall_push(rect: pygame.Rect, wall_rect: pygame.Rect) -> tuple:
+    """
+    Calculate the smallest push that moves a rect out of an overlapping wall.
+
+    Parameters:
+    - rect: The rect of the moving object.
+    - wall_rect: The rect of the wall it overlaps.
+
+    Returns:
+    - A tuple containing the x and y components of the push, one of which is 0.
+    """
+    push_right = wall_rect.right - rect.left
+    push_left = rect.right - wall_rect.left
+    push_down = wall_rect.bottom - rect.top
+    push_up = rect.bottom - wall_rect.top
+
+    depth = min(push_right, push_left, push_down, push_up)
 
-    return vectors
+    if depth == push_right:
+        return push_right, 0
+    if depth == push_left:
+        return -push_left, 0
+    if depth == push_down:
+        return 0, push_down
+    return 0, -push_up
 
 def get_distance(origin_pos, target_pos) -> float:
     """
@@ -139,5 +228,6 @@ events = None
 world_reference = None
 
 global_offset = pygame.math.Vector2()
+viewport_rect = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
 delta_time = 0
 fps_limit = 120
\ No newline at end of file
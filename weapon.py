@@ -1,6 +1,5 @@
 import pygame
 import settings
-import projectile
 
 class MeleeBase():
     """
@@ -132,7 +131,7 @@ class RangeBase():
             if settings.get_distance(self.parent.pos, e.pos) < self.range:
                 if e not in targets:
                     if shots < self.multishot_count:
-                        p = projectile.Projectile(self.parent.pos.x, self.parent.pos.y, e.pos.x, e.pos.y, self.size, self.speed, self.damage, self.color)
+                        p = settings.world_reference.projectile_pool.acquire(self.parent.pos.x, self.parent.pos.y, e.px, e.py, self.size, self.speed, self.damage, self.color)
                         settings.world_reference.world_camera.add(p)
                         settings.world_reference.friendly_projectiles.add(p)
                         targets.append(e)
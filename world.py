@@ -8,6 +8,10 @@ import random
 import weapon
 import images
 import wall
+import quadtree
+import pool
+import drops
+import projectile
 
 class World():
     """
@@ -22,9 +26,14 @@ class World():
     - enemy_container: A group of enemy characters in the game world.
     - friendly_projectiles: A group of projectiles fired by the player.
     - ground_items: A group of items on the ground in the game world.
-    - collidables: A group of objects that can be collided with.
+    - collidables: A quadtree group of objects that can be collided with.
     - wall_container: A group of walls in the game world.
     - walls: A list of wall coordinates in the game world.
+    - enemy_pools: A dictionary of sprite pools for each enemy type.
+    - drop_pools: A dictionary of sprite pools for each drop class.
+    - projectile_pool: A sprite pool for friendly projectiles.
+    - enemy_collision_interval: The number of frames between enemy collision passes.
+    - enemy_collision_padding: The maximum distance overlapping enemies are jittered by.
 
     Methods:
     - __init__(background_path: str): Initializes the World object.
@@ -32,8 +41,9 @@ class World():
     - friendly_projectile_collision(): Handles collision between friendly projectiles and enemies.
     - enemy_collision(): Handles collision between enemies.
     - player_wall_collisions(): Handles collision between the player and walls.
-    - enemy_wall_collisions(): Handles collision between enemies and walls.
+    - step_enemies(dt: float, player: pygame.sprite.Sprite): Steers, moves and wall-collides every enemy.
     - create_walls(wall_array: list): Creates walls in the game world.
+    - get_wall_qtree(): Returns the quadtree of collidables, rebuilding it if walls changed.
     - draw(): Draws the game world.
     - update(): Updates the game world.
     """
@@ -60,9 +70,26 @@ class World():
         self.enemy_container = pygame.sprite.Group()
         self.friendly_projectiles = pygame.sprite.Group()
         self.ground_items = pygame.sprite.Group()
-        self.collidables = pygame.sprite.Group()
+        self.collidables = quadtree.QuadTreeGroup(depth=4)
         self.wall_container = pygame.sprite.Group()
 
+        self.enemy_pools = {
+            "follower": pool.SpritePool(enemy.FollowEnemy, 20, 0, 0),
+            "flyer follower": pool.SpritePool(enemy.FlyerEnemy, 20, 0, 0)
+        }
+        self.drop_pools = {
+            drops.HealthDrop: pool.SpritePool(drops.HealthDrop, 10, 0, 0),
+            drops.CoinDrop: pool.SpritePool(drops.CoinDrop, 10, 0, 0)
+        }
+
+        self.enemy_collision_interval = 3
+        self.enemy_collision_padding = 10
+
+        self._enemy_grid = {}
+        self._collision_tick = 0
+        self._jitter_buffer = [random.randint(-self.enemy_collision_padding, self.enemy_collision_padding) for j in range(8192)]
+        self._jitter_index = 0
+
         self.walls = [
             [0, 0, 1, 20]
         ]
@@ -72,6 +99,14 @@ class World():
 
         self.player.weapons.append(weapon.RangeMultishot())
 
+        # Pre-warm projectiles from the starting weapon, fired from and at the player
+        starting_weapon = self.player.weapons[0]
+        self.projectile_pool = pool.SpritePool(projectile.Projectile, 20,
+                                               self.player.pos.x, self.player.pos.y,
+                                               self.player.pos.x, self.player.pos.y,
+                                               starting_weapon.size, starting_weapon.speed,
+                                               starting_weapon.damage, starting_weapon.color)
+
         self.create_enemies(10, "flyer follower")
         self.create_walls(self.walls)
 
@@ -86,18 +121,19 @@ class World():
         Returns:
         - None
         """
-        if etype == "follower":
-            for c in range(count):
-                c = enemy.FollowEnemy(random.randint(0, settings.SCREEN_WIDTH), random.randint(0, settings.SCREEN_HEIGHT))
-                c.particle_system = particle.EnemyParticleSystem(c.pos.x, c.pos.y)
-                self.world_camera.add(c)
-                self.enemy_container.add(c)
-        elif etype == "flyer follower":
-            for c in range(count):
-                c = enemy.FlyerEnemy(random.randint(0, settings.SCREEN_WIDTH), random.randint(0, settings.SCREEN_HEIGHT))
-                c.particle_system = particle.EnemyParticleSystem(c.pos.x, c.pos.y)
-                self.world_camera.add(c)
-                self.enemy_container.add(c)
+        enemy_pool = self.enemy_pools.get(etype)
+
+        if enemy_pool is None:
+            return
+
+        for c in range(count):
+            c = enemy_pool.acquire(random.randint(0, settings.SCREEN_WIDTH), random.randint(0, settings.SCREEN_HEIGHT))
+            if c.particle_system is None:
+                c.particle_system = particle.EnemyParticleSystem(c.px, c.py)
+            self.world_camera.add(c)
+            self.enemy_container.add(c)
+            c.follows_player = "follower" in c.tag
+            c.collides_with_walls = "flyer" not in c.tag
 
     def friendly_projectile_collision(self) -> None:
         """
@@ -106,27 +142,52 @@ class World():
         Returns:
         - None
         """
-        for e in self.enemy_container:
-            for p in self.friendly_projectiles:
-                if e.rect.colliderect(p.rect):
-                    e.health -= p.damage
-                    p.kill()
+        hits = pygame.sprite.groupcollide(self.friendly_projectiles, self.enemy_container, True, False)
+
+        # A projectile only damages the first enemy it hits
+        for p, enemies in hits.items():
+            enemies[0].health -= p.damage
 
     def enemy_collision(self) -> None:
         """
         Handles collision between enemies.
 
+        Pairs where neither enemy has moved since its last update are skipped.
+
         Returns:
         - None
         """
-        padding = 10
+        cell_shift = 6
+        neighbor_offsets = ((1, 0), (0, 1), (1, 1), (-1, 1))
+
+        grid = self._enemy_grid
+        grid.clear()
+
+        # Jitter values are read four at a time from a pre-generated ring buffer
+        jitter = self._jitter_buffer
+        jitter_mask = len(jitter) - 1
+        k = self._jitter_index
 
         for e in self.enemy_container:
-            for e2 in self.enemy_container:
-                if e != e2:
-                    if e.rect.colliderect(e2.rect):
-                        e.pos.x += random.randint(-padding, padding)
-                        e.pos.y += random.randint(-padding, padding)
+            grid.setdefault((e.rect.centerx >> cell_shift, e.rect.centery >> cell_shift), []).append(e)
+
+        for (cx, cy), cell in grid.items():
+            candidates = list(cell)
+            for ox, oy in neighbor_offsets:
+                candidates.extend(grid.get((cx + ox, cy + oy), ()))
+            candidate_rects = [c.rect for c in candidates]
+
+            for i, e in enumerate(cell):
+                for j in e.rect.collidelistall(candidate_rects):
+                    e2 = candidates[j]
+                    if j > i and (e.moved or e2.moved):
+                        e.px += jitter[k]
+                        e.py += jitter[k + 1]
+                        e2.px += jitter[k + 2]
+                        e2.py += jitter[k + 3]
+                        k = (k + 4) & jitter_mask
+
+        self._jitter_index = k
 
     def player_wall_collisions(self) -> None:
         """
@@ -135,48 +196,63 @@ class World():
         Returns:
         - None
         """
-        collision_tollerance = 15
+        get_wall_push = settings.get_wall_push
+
+        for c in self.get_wall_qtree().hit(self.player.rect):
+            # An earlier push this frame may already have cleared this wall
+            if not self.player.rect.colliderect(c.rect):
+                continue
+            dx, dy = get_wall_push(self.player.rect, c.rect)
+            self.player.rect.move_ip(dx, dy)
+            if dx:
+                self.player.vel.x = 0
+                self.player.pos.x += dx
+            else:
+                self.player.vel.y = 0
+                self.player.pos.y += dy
+
+    def step_enemies(self, dt: float, player: pygame.sprite.Sprite) -> None:
+        """
+        Steers, moves and resolves wall collisions for every enemy in a single pass.
 
-        for c in self.collidables:
-            if self.player.rect.colliderect(c.rect):
-                if abs(self.player.rect.left - c.rect.right) < collision_tollerance:
-                    self.player.vel.x = 0
-                    self.player.pos.x = c.rect.right + self.player.rect.width / 2
-                if abs(self.player.rect.right - c.rect.left) < collision_tollerance:
-                    self.player.vel.x = 0
-                    self.player.pos.x = c.rect.left - self.player.rect.width / 2
-                if abs(self.player.rect.top - c.rect.bottom) < collision_tollerance:
-                    self.player.vel.y = 0
-                    self.player.pos.y = c.rect.bottom + self.player.rect.height / 2
-                if abs(self.player.rect.bottom - c.rect.top) < collision_tollerance:
-                    self.player.vel.y = 0
-                    self.player.pos.y = c.rect.top - self.player.rect.height / 2
+        Enemies outside the camera view still move, but skip their particle systems.
 
-    def enemy_wall_collisions(self) -> None:
-        """
-        Handles collision between enemies and walls.
+        Parameters:
+        - dt (float): The frame delta time.
+        - player (pygame.sprite.Sprite): The player followers steer towards.
 
         Returns:
         - None
         """
-        collision_tollerance = 15
-
-        for e in self.enemy_container:
-            if "flyer" not in e.tag:
-                for c in self.collidables:
-                    if e.rect.colliderect(c.rect):
-                        if abs(e.rect.left - c.rect.right) < collision_tollerance:
-                            e.vel.x = 0
-                            e.pos.x = c.rect.right + e.rect.width / 2
-                        if abs(e.rect.right - c.rect.left) < collision_tollerance:
-                            e.vel.x = 0
-                            e.pos.x = c.rect.left - e.rect.width / 2
-                        if abs(e.rect.top - c.rect.bottom) < collision_tollerance:
-                            e.vel.y = 0
-                            e.pos.y = c.rect.bottom + e.rect.height / 2
-                        if abs(e.rect.bottom - c.rect.top) < collision_tollerance:
-                            e.vel.y = 0
-                            e.pos.y = c.rect.top - e.rect.height / 2
+        target_x = player.pos.x
+        target_y = player.pos.y
+        get_direction_vectors = settings.get_direction_vectors
+        get_wall_push = settings.get_wall_push
+
+        view_rect = settings.viewport_rect
+        wall_qtree = self.get_wall_qtree()
+        wall_bounds = wall_qtree.bounds
+
+        for e in self.enemy_container.sprites():
+            if e.follows_player:
+                e.vx, e.vy = get_direction_vectors(e.px, e.py, target_x, target_y, e.speed)
+
+            e.update(dt, view_rect)
+
+            if not e.collides_with_walls or not e.alive() or not wall_bounds.colliderect(e.rect):
+                continue
+
+            for c in wall_qtree.hit(e.rect):
+                if not e.rect.colliderect(c.rect):
+                    continue
+                dx, dy = get_wall_push(e.rect, c.rect)
+                e.rect.move_ip(dx, dy)
+                if dx:
+                    e.vx = 0
+                    e.px += dx
+                else:
+                    e.vy = 0
+                    e.py += dy
 
     def create_walls(self, wall_array: list) -> None:
         """
@@ -188,11 +264,21 @@ class World():
         Returns:
         - None
         """
-        for point_array in range(len(wall_array)):
-            w = wall.Wall(wall_array[point_array][0], wall_array[point_array][1], wall_array[point_array][2], wall_array[point_array][3])
-            self.world_camera.add(w)
-            self.collidables.add(w)
-            self.wall_container.add(w)
+        Wall = wall.Wall
+        walls = [Wall(*points) for points in wall_array]
+
+        self.world_camera.add(*walls)
+        self.collidables.add(*walls)
+        self.wall_container.add(*walls)
+
+    def get_wall_qtree(self) -> quadtree.FastQuadTree:
+        """
+        Returns the quadtree of collidables, rebuilding it if walls changed.
+
+        Returns:
+        - quadtree.FastQuadTree: The quadtree of collidables.
+        """
+        return self.collidables.get_qtree()
 
     def draw(self) -> None:
         """
@@ -210,17 +296,18 @@ class World():
         Returns:
         - None
         """
+        dt = settings.delta_time
+        player = self.player
+
         self.world_camera.update()
         self.particle_group.update()
-        self.enemy_container.update()
+        self.step_enemies(dt, player)
         self.friendly_projectiles.update()
         self.ground_items.update()
 
         self.friendly_projectile_collision()
-        self.enemy_collision()
-        self.player_wall_collisions()
-        self.enemy_wall_collisions()
+        if self._collision_tick % self.enemy_collision_interval == 0:
+            self.enemy_collision()
+        self._collision_tick += 1
 
-        for e in self.enemy_container:
-            if "follower" in e.tag:
-                e.follow_player()
\ No newline at end of file
+        self.player_wall_collisions()
\ No newline at end of file